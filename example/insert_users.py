@@ -1,8 +1,10 @@
 from mysql_connection_pool import MySQLConnectionPool
 
-def insert_users():
+def insert_users(users=None):
     db = MySQLConnectionPool.get_instance()
-    db.commit_execute(
+    if users is None:
+        users = [("John Doe", 30)]
+    db.commit_executemany(
         "INSERT INTO users (name, age) VALUES (%s, %s)",
-        ("John Doe", 30)
+        users
     )
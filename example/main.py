@@ -1,5 +1,4 @@
 from mysql_connection_pool import MySQLConnectionPool
-from create_table import *
 from insert_users import *
 
 # Initialize the connection pool
@@ -12,19 +11,21 @@ db = MySQLConnectionPool(
     pool_size=5,
     dictionary=True,
 )
-# Insert data and get the last inserted ID
-rowcount, last_id = db.commit_execute(
-    "CREATE DATABASE test_db; "
-)
-print(f"Database created with rowcount: {rowcount}, last_id: {last_id}")
+# Create the database, the users table and a first user in a single round-trip
+results = db.script("""
+    CREATE DATABASE IF NOT EXISTS test_db;
+    USE test_db;
+    CREATE TABLE IF NOT EXISTS users (id INT AUTO_INCREMENT PRIMARY KEY, name VARCHAR(100), age INT);
+    INSERT INTO users (name, age) VALUES ('John Doe', 30);
+""")
+print(f"Bootstrap script ran {len(results)} statements")
 
 # Switch to the new database created
 print(f"Current database: {db.get_current_database()}")
 db.switch_database('test_db')
 print(f"Current database: {db.get_current_database()}")
 
-create_table()
-insert_users()
+insert_users([("Jane Doe", 28), ("Max Mustermann", 41)])
 
 read = db.execute_safe(
     "SELECT * FROM users;"
@@ -1,4 +1,5 @@
-from .connection import MySQLConnectionPool
+from .connection import MySQLConnectionPool, PipelineResult, Row
+from .aio import AsyncMySQLConnectionPool, ConnectionStrategy
 
-__all__ = ['MySQLConnectionPool']
+__all__ = ['MySQLConnectionPool', 'PipelineResult', 'Row', 'AsyncMySQLConnectionPool', 'ConnectionStrategy']
 __version__ = '1.1.2'
\ No newline at end of file
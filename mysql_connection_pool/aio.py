@@ -0,0 +1,299 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Tuple, Union, List, Protocol, Type
+
+from .connection import MySQLConnectionPoolLogger
+
+
+class ConnectionStrategy(Protocol):
+    """
+    Backend used by AsyncMySQLConnectionPool to create its pool and cursors.
+
+    Implement this to plug a different async driver into the pool wrapper.
+    """
+
+    async def create_pool(self, **config) -> Any:
+        """Create and return the driver's connection pool."""
+        ...
+
+    def cursor_class(self, dictionary: bool) -> Optional[Type]:
+        """Return the cursor class to use for queries."""
+        ...
+
+
+class AiomysqlStrategy:
+    """Default ConnectionStrategy backed by aiomysql."""
+
+    def __init__(self):
+        try:
+            import aiomysql
+        except ImportError as e:
+            raise ImportError(
+                "AsyncMySQLConnectionPool requires aiomysql. "
+                "Install it with: pip install mysql-connection-pool[async]"
+            ) from e
+        self._aiomysql = aiomysql
+
+    async def create_pool(self, **config) -> Any:
+        return await self._aiomysql.create_pool(**config)
+
+    def cursor_class(self, dictionary: bool) -> Optional[Type]:
+        return self._aiomysql.DictCursor if dictionary else self._aiomysql.Cursor
+
+
+class AsyncMySQLConnectionPool:
+    """
+    An asyncio MySQL connection pool manager with database switching capability.
+
+    Takes the same connection and logging options as MySQLConnectionPool and
+    offers its core query methods (execute_safe, fetchone, fetchall,
+    commit_execute) as coroutines, so many queries can be in flight on a single
+    thread while the event loop waits on the network. The underlying pool is
+    created lazily on first use.
+
+    Basic Usage:
+        >>> from mysql_connection_pool import AsyncMySQLConnectionPool
+        >>> db = AsyncMySQLConnectionPool(host='localhost', user='root', database='test')
+        >>> results = await db.fetchall("SELECT * FROM users")
+        >>> await db.close()
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 3306,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        database: Optional[str] = None,
+        dictionary: bool = True,
+        pool_size: int = 5,
+        logs: Optional[str] = None,
+        log_language: str = "es",
+        clear_logs: bool = False,
+        strategy: Optional[ConnectionStrategy] = None,
+        **kwargs
+    ):
+        """
+        Store the pool configuration. No connection is opened until the first query.
+
+        Args:
+            host: MySQL server host
+            port: MySQL port (default 3306)
+            user: MySQL username
+            password: MySQL password
+            database: Database to use
+            dictionary: If True, returns results as dicts
+            pool_size: Maximum connections in pool
+            logs: Log file path (None=no logging, "logs/file.log"=relative, "/path/file.log"=absolute)
+            log_language: Language for log messages "es" or "en" (default "es")
+            clear_logs: If True, clears the log file content at startup (default False)
+            strategy: Backend used to create the pool (default aiomysql)
+            **kwargs: Additional connection parameters passed to the backend
+
+        Raises:
+            ImportError: If no strategy is given and aiomysql is not installed
+        """
+        self._strategy = strategy if strategy is not None else AiomysqlStrategy()
+        # Without a log file, leave any logger a sync pool already set up alone
+        if logs:
+            MySQLConnectionPoolLogger.setup_logger(
+                log_file_path=logs,
+                language=log_language,
+                clear_logs=clear_logs
+            )
+        self._dictionary = dictionary
+        self._current_database = database
+        self._config: Dict[str, Any] = {
+            'host': host,
+            'port': port,
+            'user': user,
+            'password': password,
+            'db': database,
+            'maxsize': pool_size,
+            'autocommit': True,
+        }
+        self._config.update(kwargs)
+        self._pool = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _ensure(self) -> Any:
+        """Create the pool on first use, exactly once."""
+        if self._pool is not None:
+            return self._pool
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await self._strategy.create_pool(**self._config)
+        return self._pool
+
+    @asynccontextmanager
+    async def _connection(self, database: Optional[str] = None):
+        """Acquire a connection using the requested (or current) database."""
+        pool = await self._ensure()
+        async with pool.acquire() as conn:
+            # select_db doesn't update conn.db, so track the selection ourselves
+            target = database or self._current_database
+            selected = getattr(conn, '_selected_db', getattr(conn, 'db', None))
+            if target and selected != target:
+                await conn.select_db(target)
+                conn._selected_db = target
+            yield conn
+
+    def _normalize_params(self, params):
+        """Helper to normalize query parameters for cursor.execute (empty becomes None)."""
+        if params is None:
+            return None
+        if isinstance(params, (tuple, list, dict)):
+            return params if params else None
+        # Single value, wrap in tuple
+        return (params,)
+
+    def _log(self, query: str, execution_context: str, rows_affected: int = 0, error: Optional[Exception] = None) -> None:
+        MySQLConnectionPoolLogger.log_statement_execution(
+            statement_num=1,
+            total_statements=1,
+            query=query,
+            success=error is None,
+            error_msg=str(error) if error is not None else "",
+            rows_affected=rows_affected,
+            execution_context=execution_context
+        )
+
+    async def switch_database(self, database: str) -> None:
+        """
+        Switch to a different database for all subsequent queries.
+
+        Args:
+            database: Name of the database to switch to
+
+        Raises:
+            ValueError: If database name contains invalid characters
+        """
+        if not all(c.isalnum() or c == '_' for c in database):
+            raise ValueError("Invalid database name. Only alphanumeric characters and underscores are allowed.")
+
+        # Already there: nothing to send
+        if database == self._current_database:
+            return
+
+        async with self._connection(database):
+            self._current_database = database
+            self._config['db'] = database
+
+    def get_current_database(self) -> Optional[str]:
+        """Get the name of the currently active database."""
+        return self._current_database
+
+    async def execute_safe(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        Execute query and automatically close resources.
+
+        Returns:
+            Results list or None for non-result queries
+        """
+        try:
+            async with self._connection(database) as conn:
+                async with conn.cursor(self._strategy.cursor_class(self._dictionary)) as cursor:
+                    await cursor.execute(query, self._normalize_params(params))
+                    results = await cursor.fetchall() if cursor.description else None
+                    if enable_logging:
+                        self._log(query, "execute_safe", cursor.rowcount)
+                    return results
+        except Exception as e:
+            if enable_logging:
+                self._log(query, "execute_safe", error=e)
+            raise e
+
+    async def fetchone(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute query and return a single row.
+
+        Returns:
+            Dict with row data or None if no results
+        """
+        try:
+            async with self._connection(database) as conn:
+                async with conn.cursor(self._strategy.cursor_class(self._dictionary)) as cursor:
+                    await cursor.execute(query, self._normalize_params(params))
+                    result = await cursor.fetchone()
+                    if enable_logging:
+                        self._log(query, "fetchone", cursor.rowcount)
+                    return result
+        except Exception as e:
+            if enable_logging:
+                self._log(query, "fetchone", error=e)
+            raise e
+
+    async def fetchall(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute query and return all rows.
+
+        Returns:
+            List[Dict] with results
+        """
+        try:
+            async with self._connection(database) as conn:
+                async with conn.cursor(self._strategy.cursor_class(self._dictionary)) as cursor:
+                    await cursor.execute(query, self._normalize_params(params))
+                    results = await cursor.fetchall()
+                    if enable_logging:
+                        self._log(query, "fetchall", cursor.rowcount)
+                    return list(results)
+        except Exception as e:
+            if enable_logging:
+                self._log(query, "fetchall", error=e)
+            raise e
+
+    async def commit_execute(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Execute write query and commit.
+
+        Returns:
+            Tuple (rowcount, lastrowid)
+        """
+        try:
+            async with self._connection(database) as conn:
+                async with conn.cursor(self._strategy.cursor_class(self._dictionary)) as cursor:
+                    await cursor.execute(query, self._normalize_params(params))
+                    await conn.commit()
+                    rows_affected = cursor.rowcount
+                    last_id = cursor.lastrowid
+                    if enable_logging:
+                        self._log(query, "commit_execute", rows_affected)
+                    return rows_affected, last_id
+        except Exception as e:
+            if enable_logging:
+                self._log(query, "commit_execute", error=e)
+            raise e
+
+    async def close(self) -> None:
+        """Close every connection in the pool and wait for them to finish."""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
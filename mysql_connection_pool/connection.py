@@ -1,13 +1,30 @@
-import mysql.connector.pooling
 import threading
-from typing import Optional, Dict, Any, Tuple, Union, List
+import queue
+import atexit
+from concurrent.futures import Future
+from contextlib import contextmanager
+import itertools
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, Tuple, Union, List, Sequence, Callable, Iterator
 import os
-import sqlglot
 import re
+import time
 import logging
-import sys
 from datetime import datetime
 
+# mysql.connector is imported by _import_connector() when the first pool is
+# created, so importing this package (e.g. for the async pool) stays cheap
+mysql = None
+
+
+def _import_connector() -> None:
+    """Import mysql.connector into this module's globals, once."""
+    global mysql
+    if mysql is None:
+        import mysql.connector.pooling
+        import mysql.connector.errors
+        import mysql.connector.errorcode
+
 
 class MySQLConnectionPoolLogger:
     """
@@ -268,6 +285,520 @@ Action: {title}"""
         return cls._log_file_path
 
 
+class Row:
+    """
+    Lightweight result row: a tuple of values plus a column-name index shared by
+    every row of the same query.
+
+    Values can be read by position (row[0]), by column name (row['name']) or as
+    attributes (row.name). Rows are much smaller than one dict per row, since
+    the column names are stored once per query.
+
+    Helper methods are underscore-prefixed (_keys, _asdict), like namedtuple's,
+    so they don't shadow columns named `keys` or `as_dict`. When a query returns
+    the same column name twice (e.g. a.id and b.id in a join), the name refers
+    to the last one, as in fetchall's dicts; use positions for the others.
+    """
+
+    __slots__ = ('_t', '_cols')
+
+    def __init__(self, values: Tuple, columns: Dict[str, int]):
+        self._t = values
+        self._cols = columns
+
+    def __getitem__(self, key: Union[int, slice, str]) -> Any:
+        if isinstance(key, str):
+            return self._t[self._cols[key]]
+        return self._t[key]
+
+    def __getattr__(self, name: str) -> Any:
+        # Unset slots (e.g. while copying or unpickling) must not recurse
+        if name in Row.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._t[self._cols[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return len(self._t)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._t)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Row):
+            return self._t == other._t and self._cols == other._cols
+        return self._t == other
+
+    def __hash__(self) -> int:
+        return hash(self._t)
+
+    def __repr__(self) -> str:
+        # Resolve through the index: duplicate column names (e.g. from joins)
+        # leave it with fewer names than values
+        return f"Row({', '.join(f'{name}={self._t[i]!r}' for name, i in self._cols.items())})"
+
+    def _keys(self) -> List[str]:
+        """Column names, in order."""
+        return list(self._cols)
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Build a regular dict for this row."""
+        return {name: self._t[i] for name, i in self._cols.items()}
+
+
+class PipelineResult:
+    """
+    Placeholder for the result of a statement queued in a pipeline.
+
+    Values are filled in when the pipeline is flushed at the end of its
+    `with` block; reading them before that raises RuntimeError.
+    """
+
+    __slots__ = ('query', '_done', '_rowcount', '_lastrowid', '_rows')
+
+    def __init__(self, query: str):
+        self.query = query
+        self._done = False
+        self._rowcount = None
+        self._lastrowid = None
+        self._rows = None
+
+    def _set(self, rowcount: int, lastrowid: Optional[int], rows: Optional[List[Any]]) -> None:
+        self._rowcount = rowcount
+        self._lastrowid = lastrowid
+        self._rows = rows
+        self._done = True
+
+    def _check(self) -> None:
+        if not self._done:
+            raise RuntimeError("Pipeline has not been flushed yet.")
+
+    @property
+    def done(self) -> bool:
+        """Whether the pipeline has been flushed and this result is available."""
+        return self._done
+
+    @property
+    def rowcount(self) -> int:
+        """Number of rows affected by the statement."""
+        self._check()
+        return self._rowcount
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        """ID of the last inserted row, if any."""
+        self._check()
+        return self._lastrowid
+
+    @property
+    def rows(self) -> Optional[List[Any]]:
+        """Rows returned by the statement, or None for non-result statements."""
+        self._check()
+        return self._rows
+
+    def result(self) -> Tuple[int, Optional[int], Optional[List[Any]]]:
+        """Return (rowcount, lastrowid, rows) for the statement."""
+        self._check()
+        return self._rowcount, self._lastrowid, self._rows
+
+
+class _Pipeline:
+    """
+    Buffers statements and sends them to the server as a single multi-statement
+    query when the `with` block exits. Created by MySQLConnectionPool.pipeline().
+    """
+
+    __slots__ = ('_db', '_database', '_enable_logging', '_statements', '_results')
+
+    def __init__(self, db: 'MySQLConnectionPool', database: Optional[str] = None, enable_logging: bool = True):
+        self._db = db
+        self._database = database
+        self._enable_logging = enable_logging
+        self._statements: List[Tuple[str, Optional[Union[Tuple, Dict]]]] = []
+        self._results: List[PipelineResult] = []
+
+    def __enter__(self) -> '_Pipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            # Don't send anything if the block itself failed
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._statements = []
+            self._results = []
+        return False
+
+    def add(self, query: str, params: Optional[Union[Tuple, Dict]] = None) -> PipelineResult:
+        """
+        Queue a statement for execution when the pipeline is flushed.
+
+        Parameters are substituted client-side at flush time, escaped for the
+        connection the pipeline runs on, since multi-statement queries can't
+        use server-side binding.
+
+        Args:
+            query: SQL query with optional parameters (%s or %(name)s)
+            params: Query parameters
+
+        Returns:
+            PipelineResult filled in when the pipeline is flushed
+        """
+        result = PipelineResult(query)
+        self._statements.append((query, self._db._normalize_params(params)))
+        self._results.append(result)
+        return result
+
+    def flush(self) -> List[PipelineResult]:
+        """
+        Send all queued statements in one round-trip and fill in their results.
+
+        Returns:
+            List of PipelineResult in the order statements were added
+        """
+        if not self._statements:
+            return []
+
+        statements, results = self._statements, self._results
+        self._statements, self._results = [], []
+        total = len(statements)
+        index = 0
+
+        conn = self._db._get_connection()
+        try:
+            if self._database:
+                self._db._use_database(conn, self._database)
+            # A newline ends any trailing -- or # comment before the next statement
+            operation = b";\n".join(_render_statement(conn, query, params) for query, params in statements)
+            with conn.cursor(dictionary=self._db._dictionary) as cursor:
+                for result_cursor in _execute_multi(cursor, operation):
+                    rows = result_cursor.fetchall() if result_cursor.with_rows else None
+                    results[index]._set(result_cursor.rowcount, result_cursor.lastrowid, rows)
+
+                    # Log if enabled
+                    if self._enable_logging:
+                        MySQLConnectionPoolLogger.log_statement_execution(
+                            statement_num=index + 1,
+                            total_statements=total,
+                            query=statements[index][0],
+                            success=True,
+                            rows_affected=result_cursor.rowcount,
+                            execution_context="pipeline"
+                        )
+                    index += 1
+                if index < total:
+                    raise mysql.connector.errors.ProgrammingError(
+                        f"Got {index} results for {total} pipeline statements"
+                    )
+                conn.commit()
+            return results
+        except Exception as e:
+            if self._enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=min(index + 1, total),
+                    total_statements=total,
+                    query=statements[min(index, total - 1)][0],
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="pipeline"
+                )
+            raise e
+        finally:
+            self._db._release_connection(conn)
+
+
+# Bytes MySQLConverter.escape() prefixes with a backslash
+_ESCAPED_BYTES = (b'\\', b'\n', b'\r', b"'", b'"', b'\x00', b'\x1a')
+
+_RE_PARAM = re.compile(rb'%s')
+_RE_NAMED_PARAM = re.compile(rb'%\(([^)]+)\)s')
+
+
+def _render_statement(conn, query: str, params: Optional[Union[Tuple, List, Dict]]) -> bytes:
+    """
+    Substitute params into query client-side, as SQL literals escaped for conn.
+
+    Used where statements are sent as raw or multi-statement queries, which
+    can't use server-side parameter binding. Like the connector's cursors,
+    only %s and %(name)s placeholders are replaced, so other % signs (e.g.
+    LIKE 'J%') are left alone. Values are escaped with the connection's own
+    converter and sql_mode, and the statement is built as bytes, with binary
+    values as hex literals. Trailing semicolons are dropped.
+    """
+    charset = getattr(conn, 'python_charset', None) or 'utf-8'
+    statement = query.strip().rstrip(';').strip().encode(charset)
+    if params is None:
+        return statement
+
+    converter = getattr(conn, 'converter', None)
+    sql_mode = conn.sql_mode if converter is not None else None
+
+    def quote(value: Any) -> bytes:
+        if isinstance(value, (bytes, bytearray)):
+            # Hex literals need no escaping under any sql_mode or charset
+            return b"X'" + bytes(value).hex().encode('ascii') + b"'"
+        if converter is None:
+            # C extension without a converter class escapes through the connection itself
+            return conn.prepare_for_mysql((value,))[0]
+        return converter.quote(converter.escape(converter.to_mysql(value), sql_mode))
+
+    if isinstance(params, dict):
+        values = {key.encode(charset): quote(value) for key, value in params.items()}
+
+        def named(match: 're.Match') -> bytes:
+            try:
+                return values[match.group(1)]
+            except KeyError:
+                raise mysql.connector.errors.ProgrammingError(
+                    f"Parameter '{match.group(1).decode(charset)}' is missing from params"
+                ) from None
+
+        return _RE_NAMED_PARAM.sub(named, statement)
+
+    parts = _RE_PARAM.split(statement)
+    if len(parts) - 1 != len(params):
+        raise mysql.connector.errors.ProgrammingError(
+            "Not all parameters were used in the SQL statement"
+        )
+    rendered = [parts[0]]
+    for value, part in zip(params, parts[1:]):
+        rendered.append(quote(value))
+        rendered.append(part)
+    return b''.join(rendered)
+
+
+def _execute_multi(cursor, operation: Union[str, bytes]):
+    """
+    Execute a multi-statement query and yield the cursor once per result set.
+
+    mysql-connector < 9.2 needs `multi=True` and returns an iterator; newer
+    versions dropped the argument and expose further result sets via nextset().
+    """
+    try:
+        results = cursor.execute(operation, multi=True)
+    except TypeError:
+        results = None
+    else:
+        yield from results
+        return
+
+    cursor.execute(operation)
+    yield cursor
+    while cursor.nextset():
+        yield cursor
+
+
+class _DequeQueue:
+    """
+    Drop-in replacement for the queue.Queue that mysql-connector's pool keeps
+    idle connections in.
+
+    The connector only touches that queue without blocking and while holding
+    its own pool lock, so Queue's extra mutex and condition variables are pure
+    overhead inside the critical section. deque append/popleft are atomic C
+    calls, which keeps checkout and release as short as possible.
+    """
+
+    __slots__ = ('_items', '_maxsize')
+
+    def __init__(self, maxsize: int):
+        self._items = deque()
+        self._maxsize = maxsize
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        if len(self._items) >= self._maxsize:
+            raise queue.Full
+        self._items.append(item)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return len(self._items) >= self._maxsize
+
+    @classmethod
+    def install(cls, pool) -> None:
+        """Swap pool's idle-connection queue for a deque, keeping the connections it holds."""
+        old = getattr(pool, '_cnx_queue', None)
+        # Leave driver versions with a different pool layout untouched
+        if not isinstance(old, queue.Queue):
+            return
+        new = cls(old.maxsize)
+        while True:
+            try:
+                new.put(old.get(block=False))
+            except queue.Empty:
+                break
+        pool._cnx_queue = new
+
+
+class _BackgroundWriter:
+    """
+    Worker thread that executes statements queued by MySQLConnectionPool.submit_async().
+
+    Queued statements are drained in batches of up to `batch_size` and sent as a
+    single multi-statement query. A pooled connection is checked out for each
+    batch and released right after, so the writer only holds one while it is
+    actually writing. Each statement's Future receives (rowcount, lastrowid, rows).
+    """
+
+    __slots__ = ('_db', '_batch_size', '_queue', '_retry', '_backoff', '_thread')
+
+    def __init__(self, db: 'MySQLConnectionPool', batch_size: int):
+        self._db = db
+        self._batch_size = batch_size
+        self._queue: 'queue.Queue[Tuple[Optional[Tuple[str, Any]], Future]]' = queue.Queue()
+        # Statements cut off by a failure in their batch, run ahead of the queue
+        self._retry: deque = deque()
+        # Seconds to wait before retrying a batch while the pool is exhausted
+        self._backoff = 0.01
+        self._thread = threading.Thread(target=self._run, name="mysql_pool_writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, query: str, params: Optional[Union[Tuple, List, Dict]]) -> Future:
+        future: Future = Future()
+        # Rendered by the worker, which escapes for the connection it runs on
+        self._queue.put(((query, params), future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every statement queued so far has been executed."""
+        marker: Future = Future()
+        self._queue.put((None, marker))
+        marker.result(timeout)
+
+    def _next_batch(self) -> List[Tuple[Optional[Tuple[str, Any]], Future]]:
+        batch = []
+        while self._retry and len(batch) < self._batch_size:
+            batch.append(self._retry.popleft())
+        if not batch:
+            batch.append(self._queue.get())
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+
+            # Skip statements whose caller cancelled the future while it was
+            # queued; retried ones are already running
+            pending = [(stmt, future) for stmt, future in batch
+                       if stmt is not None and (future.running() or future.set_running_or_notify_cancel())]
+            leftover = self._execute(pending) if pending else []
+            markers = [item for item in batch if item[0] is None]
+            if leftover:
+                # Flush markers wait behind the statements that still have to run
+                self._retry.extendleft(reversed(leftover + markers))
+                continue
+            # Flush markers complete only after everything queued before them
+            for _, future in markers:
+                future.set_result(None)
+
+    def _execute(self, batch: List[Tuple[Tuple[str, Any], Future]]) -> List[Tuple[Tuple[str, Any], Future]]:
+        """
+        Run batch as one multi-statement query.
+
+        Returns the statements that never reached the server, so they can go
+        first in the next batch. A statement the server rejects fails on its
+        own. If the pool is exhausted the whole batch is retried after a short
+        back-off. A lost connection fails every unresolved statement instead:
+        the server may already have run them, and re-sending could write twice.
+        """
+        try:
+            conn = self._db._get_connection(use_session=False)
+        except mysql.connector.errors.PoolError:
+            # The connector doesn't wait for a free connection, so do it here
+            time.sleep(self._backoff)
+            self._backoff = min(self._backoff * 2, 1.0)
+            return batch
+        except Exception as e:
+            self._fail(batch, 0, e, batch)
+            return []
+        self._backoff = 0.01
+
+        index = 0
+        try:
+            statements = []
+            for index, ((query, params), _) in enumerate(batch):
+                try:
+                    statements.append(_render_statement(conn, query, params))
+                except Exception as e:
+                    # Nothing was sent yet: only the unrenderable statement fails
+                    self._fail(batch, index, e, batch[index:index + 1])
+                    return batch[:index] + batch[index + 1:]
+            index = 0
+            with conn.cursor(dictionary=self._db._dictionary) as cursor:
+                # A newline ends any trailing -- or # comment before the next statement
+                for result_cursor in _execute_multi(cursor, b";\n".join(statements)):
+                    rows = result_cursor.fetchall() if result_cursor.with_rows else None
+                    batch[index][1].set_result((result_cursor.rowcount, result_cursor.lastrowid, rows))
+                    index += 1
+                if index < len(batch):
+                    raise mysql.connector.errors.ProgrammingError(
+                        f"Got {index} results for {len(batch)} statements"
+                    )
+                conn.commit()
+            return []
+        except Exception as e:
+            if index >= len(batch):
+                # Every statement already has its result; only the commit failed
+                self._fail(batch, len(batch) - 1, e, [])
+                return []
+            if _is_server_error(e):
+                # The server stops at the statement it rejects; the rest never ran
+                self._fail(batch, index, e, batch[index:index + 1])
+                return batch[index + 1:]
+            self._fail(batch, index, e, batch[index:])
+            return []
+        finally:
+            MySQLConnectionPool.safe_close_connection(conn)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Tuple[str, Any], Future]], index: int, error: Exception,
+              failed: List[Tuple[Tuple[str, Any], Future]]) -> None:
+        """Log error against batch[index] and set it on the futures of the failed statements."""
+        MySQLConnectionPoolLogger.log_statement_execution(
+            statement_num=index + 1,
+            total_statements=len(batch),
+            query=batch[index][0][0],
+            success=False,
+            error_msg=str(error),
+            execution_context="submit_async"
+        )
+        for _, future in failed:
+            future.set_exception(error)
+
+
+def _is_server_error(error: Exception) -> bool:
+    """Whether error is the server rejecting a statement, rather than the connection failing."""
+    errno = getattr(error, 'errno', None)
+    # 2000-2999 are client-side errors such as CR_SERVER_LOST
+    return (isinstance(error, mysql.connector.errors.DatabaseError)
+            and errno is not None and not 2000 <= errno < 3000)
+
+
 class MySQLConnectionPool:
     """
     A thread-safe MySQL connection pool manager with database switching capability.
@@ -282,6 +813,7 @@ class MySQLConnectionPool:
     
     Class Attributes:
         _pool: MySQLConnectionPool - Shared connection pool
+        _acquire: Callable - Bound get_connection of the shared pool
         _lock: threading.Lock - Lock for thread-safe pool initialization
         _dictionary: bool - Whether to return results as dictionaries
         _instance: MySQLConnectionPool - Singleton instance      Basic Usage:
@@ -292,7 +824,11 @@ class MySQLConnectionPool:
         >>> db.switch_database('new_database')  # Switch to a different database
     """
     
-    _pool: mysql.connector.pooling.MySQLConnectionPool = None
+    # All state is shared at class level, so instances need no __dict__
+    __slots__ = ()
+    
+    _pool: 'mysql.connector.pooling.MySQLConnectionPool' = None
+    _acquire: Optional[Callable[[], Any]] = None
     _lock: threading.Lock = threading.Lock()
     _dictionary: bool = True
     _instance = None
@@ -300,6 +836,14 @@ class MySQLConnectionPool:
     _connection_params: Dict[str, Any] = {}
     _log_language: str = "es"
     _log_file_path: Optional[str] = None
+    # Prepared cursors per physical connection: id(cnx) -> {(database, query): cursor}
+    _pstmt_cache: Dict[int, 'OrderedDict[Tuple[Optional[str], str], Any]'] = {}
+    _pstmt_cache_size: int = 128
+    _max_allowed_packet: Optional[int] = None
+    # Per-thread leased connection for session(): .conn and its selected .database
+    _tls = threading.local()
+    _writer: Optional[_BackgroundWriter] = None
+    _async_batch_size: int = 100
     def __init__(
         self,
         host: str = "localhost",
@@ -313,6 +857,7 @@ class MySQLConnectionPool:
         logs: Optional[str] = None,
         log_language: str = "es",
         clear_logs: bool = False,
+        reset_on_release: bool = False,
         **kwargs
     ):
         """
@@ -330,13 +875,28 @@ class MySQLConnectionPool:
             logs: Log file path (None=no logging, "logs/file.log"=relative, "/path/file.log"=absolute)
             log_language: Language for log messages "es" or "en" (default "es")
             clear_logs: If True, clears the log file content at startup (default False)
-            **kwargs: Additional connection parameters
+            reset_on_release: If True, reset the session state of each connection when
+                              it's returned to the pool. Costs an extra round-trip per
+                              query; only needed if queries change session variables,
+                              temporary tables or similar state (default False)
+            **kwargs: Additional connection parameters (e.g. use_pure=True to force
+                      the pure-Python driver; by default the C extension is used
+                      when available)
             
         Raises:
             mysql.connector.Error: If initial connection fails
         """
+        # Fast path: once the pool exists, construction skips the lock entirely
+        if MySQLConnectionPool._pool is not None:
+            return
+
+        # Slow path, taken only until the pool exists. Keep the lock here rather
+        # than memoizing a pool factory with functools.cache: the cache can call
+        # the factory more than once when threads race on the first call, which
+        # would open two pools under the same pool_name
         with MySQLConnectionPool._lock:
             if MySQLConnectionPool._pool is None:
+                _import_connector()
                 MySQLConnectionPool._dictionary = dictionary
                 MySQLConnectionPool._current_database = database
                 MySQLConnectionPool._log_language = log_language
@@ -357,14 +917,22 @@ class MySQLConnectionPool:
                     'pool_name': pool_name,
                     'pool_size': pool_size,
                     'autocommit': True,
-                    'pool_reset_session': True,
+                    'pool_reset_session': reset_on_release,
+                    # Prefer the C extension for protocol parsing and row decoding
+                    'use_pure': not mysql.connector.HAVE_CEXT,
                 }
                 MySQLConnectionPool._connection_params.update(kwargs)
                 
-                MySQLConnectionPool._pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool = mysql.connector.pooling.MySQLConnectionPool(
                     **MySQLConnectionPool._connection_params
                 )
+                _DequeQueue.install(pool)
+                # Bind once so every query skips the _pool.get_connection lookup
+                MySQLConnectionPool._acquire = pool.get_connection
                 MySQLConnectionPool._instance = self
+                # Publish the pool last: the unlocked check above relies on
+                # everything else being set once _pool is visible
+                MySQLConnectionPool._pool = pool
 
     def switch_database(self, database: str) -> None:
         """
@@ -379,16 +947,21 @@ class MySQLConnectionPool:
         """
         if not self._validate_db_name(database):
             raise ValueError("Invalid database name. Only alphanumeric characters and underscores are allowed.")
+        
+        # Already there: nothing to send
+        if database == self._current_database:
+            return
             
-        conn = self._get_connection()
+        # Take the connection straight from the pool (or session): no point
+        # selecting the old database just to switch away from it
+        conn = getattr(MySQLConnectionPool._tls, 'conn', None) or self._acquire()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute(f"USE `{database}`")
-                MySQLConnectionPool._current_database = database
-                # Update connection params for new connections
-                MySQLConnectionPool._connection_params['database'] = database
+            self._use_database(conn, database)
+            MySQLConnectionPool._current_database = database
+            # Update connection params for new connections
+            MySQLConnectionPool._connection_params['database'] = database
         finally:
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
 
     def _validate_db_name(self, name: str) -> bool:
         """Validate database name to prevent SQL injection"""
@@ -403,32 +976,97 @@ class MySQLConnectionPool:
         """
         return self._current_database
 
-    def _get_connection(self) -> mysql.connector.connection.MySQLConnection:
+    def _get_connection(self, use_session: bool = True) -> 'mysql.connector.connection.MySQLConnection':
         """
         Get a connection from the pool and ensure it's using the correct database.
         
+        Inside a session() block the thread's leased connection is returned
+        instead of checking one out of the pool.
+        
+        Args:
+            use_session: If False, always check out a new connection from the pool
+        
         Returns:
             MySQLConnection: Active connection
             
         Raises:
             PoolError: If no connections available after timeout
         """
-        conn = self._pool.get_connection()
+        if use_session:
+            tls = MySQLConnectionPool._tls
+            conn = getattr(tls, 'conn', None)
+            if conn is not None:
+                if self._current_database and tls.database != self._current_database:
+                    self._use_database(conn, self._current_database)
+                return conn
+
+        conn = self._acquire()
         if self._current_database:
             try:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{self._current_database}`")
+                conn.cmd_init_db(self._current_database)
             except Exception:
                 conn.close()
                 raise
         return conn
 
+    def _use_database(self, conn, database: str) -> None:
+        """Select database on conn, remembering it if conn is the thread's session connection."""
+        # COM_INIT_DB: same effect as USE without sending SQL for the server to parse
+        conn.cmd_init_db(database)
+        tls = MySQLConnectionPool._tls
+        if conn is getattr(tls, 'conn', None):
+            tls.database = database
+
+    def _release_connection(self, conn) -> None:
+        """Return conn to the pool, unless it's the thread's session connection."""
+        if conn is getattr(MySQLConnectionPool._tls, 'conn', None):
+            return
+        MySQLConnectionPool.safe_close_connection(conn)
+
+    @contextmanager
+    def session(self) -> Iterator['MySQLConnectionPool']:
+        """
+        Lease one pooled connection to the current thread for the duration of the block.
+        
+        Every query made from this thread inside the block reuses the same
+        connection instead of checking one out of the pool and returning it
+        each time. Nested sessions reuse the outer one. execute() still uses
+        its own connection, since the caller closes it.
+        
+        Yields:
+            This MySQLConnectionPool
+            
+        Example:
+            >>> with db.session():
+            ...     for user_id in user_ids:
+            ...         db.commit_execute("UPDATE users SET active = 1 WHERE id = %s", (user_id,))
+        """
+        tls = MySQLConnectionPool._tls
+        if getattr(tls, 'conn', None) is not None:
+            yield self
+            return
+
+        conn = self._get_connection(use_session=False)
+        tls.conn = conn
+        tls.database = self._current_database
+        try:
+            yield self
+        finally:
+            tls.conn = None
+            tls.database = None
+            MySQLConnectionPool.safe_close_connection(conn)
+
     def _normalize_params(self, params):
-        """Helper to normalize query parameters for cursor.execute."""
+        """
+        Helper to normalize query parameters for cursor.execute.
+        
+        Empty parameters become None, so callers use the one-argument
+        cursor.execute and skip the driver's parameter substitution.
+        """
         if params is None:
             return None
         if isinstance(params, (tuple, list, dict)):
-            return params
+            return params if params else None
         # Single value, wrap in tuple
         return (params,)
 
@@ -460,10 +1098,10 @@ class MySQLConnectionPool:
             ... finally:
             ...     conn.close()
         """
-        conn = self._get_connection()
+        # The caller closes this connection, so never hand out the session one
+        conn = self._get_connection(use_session=False)
         if database:
-            with conn.cursor() as cursor:
-                cursor.execute(f"USE `{database}`")
+            self._use_database(conn, database)
         cursor = conn.cursor(dictionary=self._dictionary)
         norm_params = self._normalize_params(params)
         
@@ -493,7 +1131,7 @@ class MySQLConnectionPool:
                     error_msg=str(e),
                     execution_context="execute"
                 )
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
             raise e
             
         return cursor, conn
@@ -523,8 +1161,7 @@ class MySQLConnectionPool:
         conn = self._get_connection()
         try:
             if database:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{database}`")
+                self._use_database(conn, database)
             with conn.cursor(dictionary=self._dictionary) as cursor:
                 norm_params = self._normalize_params(params)
                 if norm_params is not None:
@@ -558,7 +1195,7 @@ class MySQLConnectionPool:
                 )
             raise e
         finally:
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
 
     def fetchone(
         self,
@@ -585,8 +1222,7 @@ class MySQLConnectionPool:
         conn = self._get_connection()
         try:
             if database:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{database}`")
+                self._use_database(conn, database)
             with conn.cursor(dictionary=self._dictionary) as cursor:
                 norm_params = self._normalize_params(params)
                 if norm_params is not None:
@@ -620,7 +1256,7 @@ class MySQLConnectionPool:
                 )
             raise e
         finally:
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
 
     def fetchall(
         self,
@@ -647,8 +1283,7 @@ class MySQLConnectionPool:
         conn = self._get_connection()
         try:
             if database:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{database}`")
+                self._use_database(conn, database)
             with conn.cursor(dictionary=self._dictionary) as cursor:
                 norm_params = self._normalize_params(params)
                 if norm_params is not None:
@@ -682,48 +1317,46 @@ class MySQLConnectionPool:
                 )
             raise e
         finally:
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
 
-    def commit_execute(
+    def fetchall_tuples(
         self,
         query: str,
         params: Optional[Union[Tuple, Dict]] = None,
         database: Optional[str] = None,
         enable_logging: bool = True
-    ) -> Tuple[int, Optional[int]]:
+    ) -> List[Tuple]:
         """
-        Execute write query and commit.
-        
+        Execute query and return all rows as tuples.
+
+        Same as fetchall but skips building a dict per row, which is
+        noticeably cheaper on large or wide result sets.
+
         Args:
-            query: SQL query (INSERT/UPDATE/DELETE)
+            query: SQL query
             params: Query parameters
             database: Optional database to use for this query
             enable_logging: Whether to log this execution
-            
+
         Returns:
-            Tuple (rowcount, lastrowid)
-            
+            List[Tuple] with results, in column order
+
         Example:
-            >>> count, last_id = db.commit_execute(
-            ...     "INSERT INTO logs (message) VALUES (%s)",
-            ...     ("Error 404",),
-            ...     database='logging_db'
-            ... )
+            >>> for user_id, name in db.fetchall_tuples("SELECT id, name FROM users"):
+            ...     print(user_id, name)
         """
         conn = self._get_connection()
         try:
             if database:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{database}`")
-            with conn.cursor(dictionary=self._dictionary) as cursor:
+                self._use_database(conn, database)
+            with conn.cursor() as cursor:
                 norm_params = self._normalize_params(params)
                 if norm_params is not None:
                     cursor.execute(query, norm_params)
                 else:
                     cursor.execute(query)
-                conn.commit()
+                results = cursor.fetchall()
                 rows_affected = cursor.rowcount
-                last_id = cursor.lastrowid
                 
                 # Log if enabled
                 if enable_logging:
@@ -733,10 +1366,10 @@ class MySQLConnectionPool:
                         query=query,
                         success=True,
                         rows_affected=rows_affected,
-                        execution_context="commit_execute"
+                        execution_context="fetchall_tuples"
                     )
                 
-                return rows_affected, last_id
+                return results
         except Exception as e:
             if enable_logging:
                 MySQLConnectionPoolLogger.log_statement_execution(
@@ -745,66 +1378,849 @@ class MySQLConnectionPool:
                     query=query,
                     success=False,
                     error_msg=str(e),
-                    execution_context="commit_execute"
+                    execution_context="fetchall_tuples"
                 )
             raise e
         finally:
-            MySQLConnectionPool.safe_close_connection(conn)
+            self._release_connection(conn)
 
-    @staticmethod
-    def lastrowid(cursor: mysql.connector.cursor.MySQLCursor) -> Optional[int]:
-        """Return the ID of the last inserted row."""
-        return cursor.lastrowid
+    def fetchall_rows(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Tuple[Tuple[str, ...], List[Row]]:
+        """
+        Execute query and return its column names and all rows as lightweight Row objects.
 
-    @staticmethod
-    def rowcount(cursor: mysql.connector.cursor.MySQLCursor) -> int:
-        """Return the number of affected rows."""
-        return cursor.rowcount
+        Rows keep tuple storage and share a single column-name index, so they
+        cost far less memory than fetchall's one dict per row while still
+        allowing access by name.
 
-    def execute_with_logging(self, query: str, params: Optional[Union[Tuple, Dict]] = None, database: Optional[str] = None) -> Tuple[Optional[List[Dict]], int]:
-        """
-        Execute query and return results along with row count for logging.
-        
         Args:
             query: SQL query
             params: Query parameters
             database: Optional database to use for this query
-            
+            enable_logging: Whether to log this execution
+
         Returns:
-            Tuple (results, rowcount)
+            Tuple (columns, rows): the column names once, and List[Row] with results
+
+        Example:
+            >>> columns, users = db.fetchall_rows("SELECT id, name FROM users")
+            >>> for user in users:
+            ...     print(user.id, user['name'])
         """
         conn = self._get_connection()
         try:
             if database:
-                with conn.cursor() as cursor:
-                    cursor.execute(f"USE `{database}`")
-            with conn.cursor(dictionary=self._dictionary) as cursor:
+                self._use_database(conn, database)
+            with conn.cursor() as cursor:
                 norm_params = self._normalize_params(params)
                 if norm_params is not None:
                     cursor.execute(query, norm_params)
                 else:
                     cursor.execute(query)
-                results = cursor.fetchall() if cursor.with_rows else None
-                row_count = cursor.rowcount
-                return results, row_count
-        finally:
-            MySQLConnectionPool.safe_close_connection(conn)
-
-    @classmethod
-    def is_initialized(cls) -> bool:
-        """Check if the pool has been initialized."""
-        return cls._pool is not None
-    
-    @classmethod
-    def get_instance(cls):
-        """Get the singleton instance."""
-        if not cls._pool or not cls._instance:
-            raise RuntimeError("Pool not initialized. Call __init__ first.")
-        return cls._instance
-    
-    @staticmethod
-    def _remove_sql_comments(sql_content: str) -> str:
-        """Remove SQL comments while preserving string literals."""
+                names = tuple(cursor.column_names)
+                columns = {name: i for i, name in enumerate(names)}
+                results = [Row(values, columns) for values in cursor.fetchall()]
+                rows_affected = cursor.rowcount
+                
+                # Log if enabled
+                if enable_logging:
+                    MySQLConnectionPoolLogger.log_statement_execution(
+                        statement_num=1,
+                        total_statements=1,
+                        query=query,
+                        success=True,
+                        rows_affected=rows_affected,
+                        execution_context="fetchall_rows"
+                    )
+                
+                return names, results
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="fetchall_rows"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def iter_rows(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True,
+        chunk: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute query and yield rows as they stream in from the server.
+
+        Uses an unbuffered cursor and fetches `chunk` rows at a time, so large
+        result sets are never held in client memory all at once. The
+        connection stays checked out until the generator is exhausted or closed.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+            chunk: Number of rows fetched from the server per batch
+
+        Yields:
+            Dict with row data
+
+        Example:
+            >>> for order in db.iter_rows("SELECT * FROM orders"):
+            ...     process(order)
+        """
+        conn = self._get_connection()
+        rows_read = 0
+        try:
+            if database:
+                self._use_database(conn, database)
+            cursor = conn.cursor(dictionary=self._dictionary, buffered=False)
+            try:
+                norm_params = self._normalize_params(params)
+                if norm_params is not None:
+                    cursor.execute(query, norm_params)
+                else:
+                    cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(chunk)
+                    if not rows:
+                        break
+                    rows_read += len(rows)
+                    yield from rows
+            finally:
+                # Drain anything left unread (e.g. consumer stopped early)
+                # so the connection can be returned to the pool
+                try:
+                    if conn.unread_result:
+                        conn.consume_results()
+                    cursor.close()
+                except Exception:
+                    pass
+
+            # Log if enabled
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=True,
+                    rows_affected=rows_read,
+                    execution_context="iter_rows"
+                )
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="iter_rows"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def commit_execute(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Execute write query and commit.
+        
+        Args:
+            query: SQL query (INSERT/UPDATE/DELETE)
+            params: Query parameters
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+            
+        Returns:
+            Tuple (rowcount, lastrowid)
+            
+        Example:
+            >>> count, last_id = db.commit_execute(
+            ...     "INSERT INTO logs (message) VALUES (%s)",
+            ...     ("Error 404",),
+            ...     database='logging_db'
+            ... )
+        """
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            with conn.cursor(dictionary=self._dictionary) as cursor:
+                norm_params = self._normalize_params(params)
+                if norm_params is not None:
+                    cursor.execute(query, norm_params)
+                else:
+                    cursor.execute(query)
+                conn.commit()
+                rows_affected = cursor.rowcount
+                last_id = cursor.lastrowid
+                
+                # Log if enabled
+                if enable_logging:
+                    MySQLConnectionPoolLogger.log_statement_execution(
+                        statement_num=1,
+                        total_statements=1,
+                        query=query,
+                        success=True,
+                        rows_affected=rows_affected,
+                        execution_context="commit_execute"
+                    )
+                
+                return rows_affected, last_id
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="commit_execute"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def commit_executemany(
+        self,
+        query: str,
+        seq_of_params: Sequence[Union[Tuple, Dict]],
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Execute a write query once per parameter set and commit.
+
+        Uses cursor.executemany, which mysql-connector rewrites into a single
+        multi-row INSERT ... VALUES (...), (...) statement for simple INSERTs,
+        so the whole batch costs one round-trip instead of one per row. Large
+        batches are split into chunks that fit under the server's
+        max_allowed_packet and committed together at the end.
+
+        Args:
+            query: SQL query (INSERT/UPDATE/DELETE)
+            seq_of_params: Sequence of parameter tuples or dicts, one per row
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+
+        Returns:
+            Tuple (rowcount, lastrowid)
+
+        Example:
+            >>> count, last_id = db.commit_executemany(
+            ...     "INSERT INTO users (name, age) VALUES (%s, %s)",
+            ...     [("John Doe", 30), ("Jane Doe", 28)]
+            ... )
+        """
+        seq_of_params = list(seq_of_params)
+        if not seq_of_params:
+            return 0, None
+
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            # executemany repeats the VALUES group once per row; the whole
+            # query is a safe upper bound for it
+            chunks = self._chunk_rows(conn, seq_of_params, len(query))
+            # Keep multi-chunk batches all-or-nothing despite autocommit
+            if len(chunks) > 1 and not conn.in_transaction:
+                conn.start_transaction()
+            rows_affected = 0
+            last_id = None
+            with conn.cursor(dictionary=self._dictionary) as cursor:
+                for chunk in chunks:
+                    cursor.executemany(query, chunk)
+                    rows_affected += cursor.rowcount
+                    last_id = cursor.lastrowid
+                conn.commit()
+
+                # Log if enabled
+                if enable_logging:
+                    MySQLConnectionPoolLogger.log_statement_execution(
+                        statement_num=1,
+                        total_statements=1,
+                        query=query,
+                        success=True,
+                        rows_affected=rows_affected,
+                        execution_context="commit_executemany"
+                    )
+
+                return rows_affected, last_id
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="commit_executemany"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def _get_max_allowed_packet(self, conn) -> int:
+        """Return the server's max_allowed_packet in bytes, queried once and cached."""
+        if MySQLConnectionPool._max_allowed_packet is None:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT @@max_allowed_packet")
+                MySQLConnectionPool._max_allowed_packet = int(cursor.fetchone()[0])
+        return MySQLConnectionPool._max_allowed_packet
+
+    @staticmethod
+    def _value_size(value: Any) -> int:
+        """Estimate the bytes value takes as an escaped SQL literal, including quotes and separator."""
+        if value is None:
+            return 6
+        data = value if isinstance(value, (bytes, bytearray)) else str(value).encode('utf-8')
+        # The converter backslash-escapes these, so each one costs two bytes
+        return len(data) + sum(map(data.count, _ESCAPED_BYTES)) + 4
+
+    def _chunk_rows(
+        self,
+        conn,
+        rows: Sequence[Union[Sequence[Any], Dict[str, Any]]],
+        row_overhead: int
+    ) -> List[Sequence[Union[Sequence[Any], Dict[str, Any]]]]:
+        """
+        Split rows into chunks whose estimated size stays under max_allowed_packet, with 20% headroom.
+
+        Every row is measured in encoded bytes, including the backslashes the
+        converter adds when escaping, so long, multi-byte or quote-heavy rows
+        can't push a chunk over the limit. A row larger than the limit
+        gets a chunk of its own and is left for the server to reject.
+        """
+        limit = int(self._get_max_allowed_packet(conn) * 0.8)
+        value_size = self._value_size
+        chunks = []
+        start = 0
+        size = 0
+        for index, row in enumerate(rows):
+            values = row.values() if isinstance(row, dict) else row
+            row_size = row_overhead + sum(value_size(value) for value in values)
+            if size + row_size > limit and index > start:
+                chunks.append(rows[start:index])
+                start = index
+                size = 0
+            size += row_size
+        chunks.append(rows[start:])
+        return chunks
+
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a table or column name (optionally schema-qualified) with backticks."""
+        parts = name.split('.')
+        if not all(part and all(c.isalnum() or c in '_$' for c in part) for part in parts):
+            raise ValueError(f"Invalid identifier: {name!r}. Only alphanumeric characters, '_' and '$' are allowed.")
+        return '.'.join(f"`{part}`" for part in parts)
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Insert many rows with multi-row INSERT ... VALUES (...), (...) statements and commit.
+
+        Rows are sent in as few statements as fit under the server's
+        max_allowed_packet, so large inserts cost a handful of round-trips
+        instead of one per row.
+
+        Args:
+            table: Table name (optionally schema-qualified)
+            columns: Column names, in the same order as each row's values
+            rows: Sequence of row value tuples
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+
+        Returns:
+            Tuple (rowcount, lastrowid)
+
+        Raises:
+            ValueError: If a table or column name contains invalid characters
+
+        Example:
+            >>> count, last_id = db.bulk_insert(
+            ...     "users", ["name", "age"],
+            ...     [("John Doe", 30), ("Jane Doe", 28)]
+            ... )
+        """
+        rows = list(rows)
+        if not rows:
+            return 0, None
+
+        column_list = ", ".join(self._quote_identifier(column) for column in columns)
+        prefix = f"INSERT INTO {self._quote_identifier(table)} ({column_list}) VALUES "
+        group = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        query = f"{prefix}{group}"
+
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            chunks = self._chunk_rows(conn, rows, len(group) + 2)
+            rows_affected = 0
+            last_id = None
+            # Keep multi-chunk inserts all-or-nothing despite autocommit
+            if len(chunks) > 1 and not conn.in_transaction:
+                conn.start_transaction()
+            with conn.cursor() as cursor:
+                for chunk in chunks:
+                    sql = prefix + ", ".join([group] * len(chunk))
+                    cursor.execute(sql, list(itertools.chain.from_iterable(chunk)))
+                    rows_affected += cursor.rowcount
+                    last_id = cursor.lastrowid
+                conn.commit()
+
+            # Log if enabled
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=True,
+                    rows_affected=rows_affected,
+                    execution_context="bulk_insert"
+                )
+
+            return rows_affected, last_id
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="bulk_insert"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def _evict_prepared(self, cnx_id: int, key: Optional[Tuple[Optional[str], str]] = None) -> None:
+        """Drop cached prepared cursors for a connection (all of them if no key given)."""
+        cache = MySQLConnectionPool._pstmt_cache.get(cnx_id)
+        if cache is None:
+            return
+        if key is None:
+            cursors = list(cache.values())
+            MySQLConnectionPool._pstmt_cache.pop(cnx_id, None)
+        else:
+            cursor = cache.pop(key, None)
+            cursors = [cursor] if cursor is not None else []
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception:
+                pass  # Statement already gone with the session
+
+    def _prepared_cursor(self, conn, cnx_id: int, key: Tuple[Optional[str], str]):
+        """Return the cached prepared cursor for key, creating it on a miss."""
+        cache = MySQLConnectionPool._pstmt_cache.setdefault(cnx_id, OrderedDict())
+        cursor = cache.get(key)
+        if cursor is not None:
+            cache.move_to_end(key)
+            return cursor, True
+
+        cursor = conn.cursor(prepared=True, dictionary=self._dictionary)
+        cache[key] = cursor
+        if len(cache) > MySQLConnectionPool._pstmt_cache_size:
+            self._evict_prepared(cnx_id, next(iter(cache)))
+        return cursor, False
+
+    def execute_prepared(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        Execute query as a server-side prepared statement, reusing it across calls.
+
+        The prepared cursor is cached per physical connection and SQL string, so
+        repeated calls with the same query skip the server-side parse and send
+        parameters over the binary protocol. When the pool resets sessions on
+        release (reset_on_release=True) the server drops prepared statements,
+        so the cache only lives for a single checkout.
+
+        Args:
+            query: SQL query with %s or ? placeholders
+            params: Query parameters
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+
+        Returns:
+            Results list or None for non-result queries
+
+        Example:
+            >>> for name, age in users:
+            ...     db.execute_prepared("INSERT INTO users (name, age) VALUES (%s, %s)", (name, age))
+        """
+        conn = self._get_connection()
+        # Pooled connections wrap a physical connection that outlives each checkout
+        cnx_id = id(getattr(conn, '_cnx', conn))
+        key = (database or self._current_database, query)
+        norm_params = self._normalize_params(params)
+        try:
+            if database:
+                self._use_database(conn, database)
+            cursor, cached = self._prepared_cursor(conn, cnx_id, key)
+            try:
+                if norm_params is not None:
+                    cursor.execute(query, norm_params)
+                else:
+                    cursor.execute(query)
+            except mysql.connector.Error as e:
+                stale = e.errno == mysql.connector.errorcode.ER_UNKNOWN_STMT_HANDLER
+                # Routine server errors (duplicate key, constraints...) leave a
+                # cached statement usable; only a lost handle or connection
+                # invalidates it. A new one may have failed to prepare at all
+                if stale or not cached or not _is_server_error(e):
+                    self._evict_prepared(cnx_id, key)
+                # Statement handle lost (e.g. after a reconnect): prepare it again
+                if not cached or not stale:
+                    raise
+                cursor, cached = self._prepared_cursor(conn, cnx_id, key)
+                if norm_params is not None:
+                    cursor.execute(query, norm_params)
+                else:
+                    cursor.execute(query)
+            results = cursor.fetchall() if cursor.with_rows else None
+            rows_affected = cursor.rowcount
+
+            # Log if enabled
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=True,
+                    rows_affected=rows_affected,
+                    execution_context="execute_prepared"
+                )
+
+            return results
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="execute_prepared"
+                )
+            raise e
+        finally:
+            leased = conn is getattr(MySQLConnectionPool._tls, 'conn', None)
+            if not leased and MySQLConnectionPool._connection_params.get('pool_reset_session'):
+                self._evict_prepared(cnx_id)
+            self._release_connection(conn)
+
+    def execute_one(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        Execute a single statement through the connection's low-level query command.
+
+        Parameters are escaped client-side with the checked-out connection's
+        converter and sql_mode, and the statement is sent with cmd_query,
+        bypassing the cursor layer and its generic parameter and
+        multi-statement handling. Only use it with trusted query shapes: the
+        statement must be exactly one SQL statement.
+
+        Args:
+            query: A single SQL statement with optional parameters (%s or %(name)s)
+            params: Query parameters
+            database: Optional database to use for this query
+            enable_logging: Whether to log this execution
+
+        Returns:
+            Results list or None for non-result queries
+
+        Example:
+            >>> user = db.execute_one("SELECT * FROM users WHERE id = %s", (1,))
+        """
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            result = conn.cmd_query(_render_statement(conn, query, self._normalize_params(params)))
+            if 'columns' in result:
+                rows, _ = conn.get_rows()
+                if self._dictionary:
+                    names = [column[0] for column in result['columns']]
+                    rows = [dict(zip(names, row)) for row in rows]
+                results = rows
+                rows_affected = len(rows)
+            else:
+                results = None
+                rows_affected = result.get('affected_rows', 0)
+
+            # Log if enabled
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=True,
+                    rows_affected=rows_affected,
+                    execution_context="execute_one"
+                )
+
+            return results
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=query,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="execute_one"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def script(
+        self,
+        sql_text: str,
+        database: Optional[str] = None,
+        enable_logging: bool = True
+    ) -> List[Tuple[int, Optional[int]]]:
+        """
+        Execute several ;-separated statements in a single round-trip.
+
+        The whole text is sent as one multi-statement query and every result is
+        consumed before the connection is returned. Useful for bootstrapping a
+        schema (CREATE DATABASE, USE, CREATE TABLE, seed INSERTs) without one
+        round-trip per statement. DELIMITER blocks aren't supported here; use
+        run_sql_file for those.
+
+        Args:
+            sql_text: SQL statements separated by semicolons
+            database: Optional database to use for this script
+            enable_logging: Whether to log this execution
+
+        Returns:
+            List of (rowcount, lastrowid) tuples, one per statement
+
+        Example:
+            >>> db.script('''
+            ...     CREATE DATABASE IF NOT EXISTS shop;
+            ...     USE shop;
+            ...     CREATE TABLE IF NOT EXISTS products (id INT PRIMARY KEY, name VARCHAR(100));
+            ... ''')
+        """
+        sql_text = sql_text.strip().rstrip(';')
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            results = []
+            with conn.cursor() as cursor:
+                for result_cursor in _execute_multi(cursor, sql_text):
+                    if result_cursor.with_rows:
+                        result_cursor.fetchall()
+                    results.append((result_cursor.rowcount, result_cursor.lastrowid))
+                conn.commit()
+            # The script may have run USE; make a session re-select its database
+            tls = MySQLConnectionPool._tls
+            if conn is getattr(tls, 'conn', None):
+                tls.database = None
+
+            # Log if enabled
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=sql_text,
+                    success=True,
+                    rows_affected=sum(max(rowcount, 0) for rowcount, _ in results),
+                    execution_context="script"
+                )
+
+            return results
+        except Exception as e:
+            if enable_logging:
+                MySQLConnectionPoolLogger.log_statement_execution(
+                    statement_num=1,
+                    total_statements=1,
+                    query=sql_text,
+                    success=False,
+                    error_msg=str(e),
+                    execution_context="script"
+                )
+            raise e
+        finally:
+            self._release_connection(conn)
+
+    def submit_async(self, query: str, params: Optional[Union[Tuple, Dict]] = None) -> Future:
+        """
+        Queue a statement for execution on a background thread and return immediately.
+
+        A single worker thread drains the queue in batches (up to
+        _async_batch_size statements) and sends each batch as one
+        multi-statement query, so the caller never waits on the network.
+        Statements run in submission order. The worker checks a pooled
+        connection out for each batch and releases it afterwards, so it only
+        takes one from the pool while it is writing.
+
+        Args:
+            query: SQL query with optional parameters (%s or %(name)s)
+            params: Query parameters (substituted client-side)
+
+        Returns:
+            Future resolving to (rowcount, lastrowid, rows). If the server
+            rejects a statement, only its Future raises and the statements
+            after it run in the next batch. If the connection is lost
+            mid-batch, every unresolved Future raises instead of being re-sent,
+            since the server may already have run it. While the pool is
+            exhausted the worker waits and retries.
+
+        Example:
+            >>> future = db.submit_async("INSERT INTO events (name) VALUES (%s)", ("login",))
+            >>> ...  # keep working
+            >>> rowcount, last_id, _ = future.result()
+        """
+        writer = MySQLConnectionPool._writer
+        if writer is None:
+            with MySQLConnectionPool._lock:
+                if MySQLConnectionPool._writer is None:
+                    MySQLConnectionPool._writer = _BackgroundWriter(self, MySQLConnectionPool._async_batch_size)
+                    # Don't lose queued writes when the interpreter exits
+                    atexit.register(MySQLConnectionPool._writer.flush)
+                writer = MySQLConnectionPool._writer
+        return writer.submit(query, self._normalize_params(params))
+
+    def flush_async(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every statement queued with submit_async() so far has been executed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+        """
+        if MySQLConnectionPool._writer is not None:
+            MySQLConnectionPool._writer.flush(timeout)
+
+    def pipeline(self, database: Optional[str] = None, enable_logging: bool = True) -> _Pipeline:
+        """
+        Buffer statements and send them in a single round-trip.
+
+        Statements added inside the `with` block are joined into one
+        multi-statement query and executed when the block exits. Each call to
+        add() returns a PipelineResult that is filled in at that point.
+        Nothing is sent if the block raises.
+
+        Args:
+            database: Optional database to use for these queries
+            enable_logging: Whether to log each statement
+
+        Returns:
+            Pipeline context manager
+
+        Example:
+            >>> with db.pipeline() as pipe:
+            ...     pipe.add("INSERT INTO users (name, age) VALUES (%s, %s)", ("John Doe", 30))
+            ...     users = pipe.add("SELECT * FROM users")
+            >>> users.rows
+        """
+        return _Pipeline(self, database, enable_logging)
+
+    @staticmethod
+    def lastrowid(cursor: 'mysql.connector.cursor.MySQLCursor') -> Optional[int]:
+        """Return the ID of the last inserted row."""
+        return cursor.lastrowid
+
+    @staticmethod
+    def rowcount(cursor: 'mysql.connector.cursor.MySQLCursor') -> int:
+        """Return the number of affected rows."""
+        return cursor.rowcount
+
+    def execute_with_logging(self, query: str, params: Optional[Union[Tuple, Dict]] = None, database: Optional[str] = None, dictionary: Optional[bool] = None) -> Tuple[Optional[List[Dict]], int]:
+        """
+        Execute query and return results along with row count for logging.
+        
+        Args:
+            query: SQL query
+            params: Query parameters
+            database: Optional database to use for this query
+            dictionary: Return rows as dicts (default: pool setting). Pass False
+                        when only the row count is needed
+            
+        Returns:
+            Tuple (results, rowcount)
+        """
+        conn = self._get_connection()
+        try:
+            if database:
+                self._use_database(conn, database)
+            with conn.cursor(dictionary=self._dictionary if dictionary is None else dictionary) as cursor:
+                norm_params = self._normalize_params(params)
+                if norm_params is not None:
+                    cursor.execute(query, norm_params)
+                else:
+                    cursor.execute(query)
+                results = cursor.fetchall() if cursor.with_rows else None
+                row_count = cursor.rowcount
+                return results, row_count
+        finally:
+            self._release_connection(conn)
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        """Check if the pool has been initialized."""
+        return cls._pool is not None
+    
+    @classmethod
+    def get_instance(cls):
+        """Get the singleton instance."""
+        if not cls._pool or not cls._instance:
+            raise RuntimeError("Pool not initialized. Call __init__ first.")
+        return cls._instance
+    
+    @staticmethod
+    def _remove_sql_comments(sql_content: str) -> str:
+        """Remove SQL comments while preserving string literals."""
         # Remove single line comments (-- comment)
         sql_content = re.sub(r'--.*$', '', sql_content, flags=re.MULTILINE)
         
@@ -872,9 +2288,9 @@ class MySQLConnectionPool:
         return statements
 
     @staticmethod
-    def _parse_sql_with_sqlglot(sql_content: str) -> List[str]:
+    def _parse_sql_statements(sql_content: str) -> List[str]:
         """
-        Parse SQL content using SQLGlot, handling DELIMITER statements and complex triggers.
+        Split SQL content into statements, handling DELIMITER statements and complex triggers.
         
         Args:
             sql_content: Raw SQL content from file
@@ -903,7 +2319,7 @@ class MySQLConnectionPool:
     @staticmethod
     def run_sql_file(file_path: str) -> None:
         """
-        Execute SQL commands from a file using SQLGlot for advanced parsing.
+        Execute SQL commands from a file, splitting it into statements.
         
         Supports:
         - DELIMITER statements for triggers and stored procedures
@@ -926,8 +2342,8 @@ class MySQLConnectionPool:
             with open(file_path, 'r', encoding='utf-8') as file:
                 sql_content = file.read()
 
-            # Parse SQL content using SQLGlot with DELIMITER support
-            statements = MySQLConnectionPool._parse_sql_with_sqlglot(sql_content)
+            # Split SQL content into statements with DELIMITER support
+            statements = MySQLConnectionPool._parse_sql_statements(sql_content)
             
             if not statements:
                 MySQLConnectionPoolLogger.log_warning("No se encontraron sentencias SQL válidas en el archivo.")
@@ -940,7 +2356,8 @@ class MySQLConnectionPool:
             for i, stmt in enumerate(statements, 1):
                 try:
                     # Execute statement and get rows affected
-                    results, rows_affected = db.execute_with_logging(stmt)
+                    # Rows are discarded here, so skip building a dict per row
+                    results, rows_affected = db.execute_with_logging(stmt, dictionary=False)
                     
                     # Log successful execution
                     MySQLConnectionPoolLogger.log_statement_execution(
@@ -1021,7 +2438,11 @@ class MySQLConnectionPool:
     def commit_execute_logged(self, query: str, params: Optional[Union[Tuple, Dict]] = None, database: Optional[str] = None) -> Tuple[int, Optional[int]]:
         """Execute write query with commit and logging enabled."""
         return self.commit_execute(query, params, database, enable_logging=True)
-    
+
+    def commit_executemany_logged(self, query: str, seq_of_params: Sequence[Union[Tuple, Dict]], database: Optional[str] = None) -> Tuple[int, Optional[int]]:
+        """Execute batched write query with commit and logging enabled."""
+        return self.commit_executemany(query, seq_of_params, database, enable_logging=True)
+
     @staticmethod
     def safe_close_connection(connection):
         """
@@ -33,7 +33,9 @@ setup(
     ],
     python_requires=">=3.8",    install_requires=[
         "mysql-connector-python>=8.4.0",
-        "sqlglot>=25.0.0",
     ],
+    extras_require={
+        "async": ["aiomysql>=0.2.0"],
+    },
     keywords="mysql database connection pool threading",
 )
\ No newline at end of file